@@ -2,7 +2,7 @@ import functools as fnt
 import importlib
 import logging
 import os
-import weakref
+import sys
 from contextlib import contextmanager
 from copy import deepcopy
 import warnings
@@ -19,6 +19,9 @@ from confect.error import (
 
 logger = logging.getLogger(__name__)
 
+# compiled configuration-file code objects, keyed by (path, mtime_ns)
+_conf_file_code_cache = {}
+
 
 class Undefined:
     """Undefined value"""
@@ -126,6 +129,26 @@ class ConfProperty:
     def value(self, value):
         self._value = value
 
+    def __deepcopy__(self, memo):
+        # ``prop_type`` instances are shared singletons and ``desc``
+        # never changes after creation; ``default`` and ``_value`` only
+        # need copying when they are mutable containers, since ``value``
+        # hands them out for in-place mutation.
+        cls = type(self)
+        new_self = cls.__new__(cls)
+        memo[id(self)] = new_self
+        default = self.default
+        if isinstance(default, (list, dict, set)):
+            default = deepcopy(default, memo)
+        new_self.default = default
+        new_self.prop_type = self.prop_type
+        new_self.desc = self.desc
+        value = self._value
+        if isinstance(value, (list, dict, set)):
+            value = deepcopy(value, memo)
+        new_self._value = value
+        return new_self
+
     def click_callback(self, ctx, param, value):
         if param.default != value:
             self._value = value
@@ -142,6 +165,45 @@ class ConfProperty:
         return f"{self.desc} [default: {self.default!s}, value: {self.value!s}]"
 
 
+class _MutateGloballyContext:
+    """Hand-rolled context manager for the unfreeze/refreeze pair.
+
+    ``@contextmanager`` would wrap every entry in generator send/throw
+    plumbing; this runs on every ``declare_group``, ``load_*`` and
+    ``mutate_locally`` call, so keep it to two plain method calls.
+    """
+
+    __slots__ = ("_frozen_cell",)
+
+    def __init__(self, frozen_cell):
+        self._frozen_cell = frozen_cell
+
+    def __enter__(self):
+        self._frozen_cell[0] = False
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self._frozen_cell[0] = True
+
+
+class _ConfectCContext:
+    """Expose the conf depot as ``confect.c`` while a config file runs."""
+
+    __slots__ = ("_conf_depot",)
+
+    def __init__(self, conf_depot):
+        self._conf_depot = conf_depot
+
+    def __enter__(self):
+        import confect
+
+        confect.c = self._conf_depot
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        import confect
+
+        del confect.c
+
+
 class Conf:
     """Configuration
 
@@ -170,12 +232,16 @@ class Conf:
 
     __slots__ = (
         "_is_setting_imported",
-        "_is_frozen",
+        "_frozen_cell",
         "_conf_depot",
         "_conf_groups",
-        "__weakref__",
+        "_mutate_globally_ctx",
+        "_c_ctx",
+        "_dir_cache",
     )
 
+    _SLOT_SET = frozenset(__slots__)
+
     def __init__(self):
         """Create a new confect.Conf object
 
@@ -197,9 +263,15 @@ class Conf:
         from confect.conf_depot import ConfDepot
 
         self._is_setting_imported = False
-        self._is_frozen = True
-        self._conf_depot = ConfDepot()
+        # one-element list shared by reference with every ConfGroup, so
+        # the frozen check on the property write path is a single
+        # indexed load instead of two attribute loads
+        self._frozen_cell = [True]
+        self._conf_depot = ConfDepot(self)
         self._conf_groups = {}
+        self._mutate_globally_ctx = _MutateGloballyContext(self._frozen_cell)
+        self._c_ctx = _ConfectCContext(self._conf_depot)
+        self._rebuild_dir_cache()
 
     def declare_group(self, name, **default_properties):
         """Add new configuration group and all property names with default values
@@ -228,6 +300,7 @@ class Conf:
         with self.mutate_globally():
             group = ConfGroup(self, name)
             self._conf_groups[name] = group
+            self._rebuild_dir_cache()
             default_setter_ctx = group._default_setter()
             if default_properties:
                 with default_setter_ctx as default_setter:
@@ -235,12 +308,6 @@ class Conf:
             else:
                 return default_setter_ctx
 
-    def _backup(self):
-        return deepcopy(self._conf_groups)
-
-    def _restore(self, conf_groups):
-        self._conf_groups = conf_groups
-
     @contextmanager
     def mutate_locally(self):
         """Return a context manager that makes this Conf mutable temporarily.
@@ -261,38 +328,48 @@ class Conf:
         fish
 
         """  # noqa
-        conf_groups_backup = self._backup()
-        with self.mutate_globally():
-            yield
-        self._restore(conf_groups_backup)
+        declared_groups = set(self._conf_groups)
+        saved_overlays = {
+            group_name: group._push_overlay()
+            for group_name, group in self._conf_groups.items()
+        }
+
+        try:
+            with self.mutate_globally():
+                yield
+        finally:
+            for group_name in list(self._conf_groups):
+                if group_name not in declared_groups:
+                    del self._conf_groups[group_name]
+            self._rebuild_dir_cache()
+
+            for group_name, overlay in saved_overlays.items():
+                self._conf_groups[group_name]._overlay = overlay
 
-    @contextmanager
     def mutate_globally(self):
-        self._is_frozen = False
-        yield
-        self._is_frozen = True
+        return self._mutate_globally_ctx
 
-    @contextmanager
     def _confect_c_ctx(self):
-        import confect
-
-        confect.c = self._conf_depot
-        yield
-        del confect.c
+        return self._c_ctx
 
     def __contains__(self, group_name):
         return group_name in self._conf_groups
 
     def __getitem__(self, group_name):
-        if group_name not in self._conf_groups:
+        conf_groups = self._conf_groups
+        if group_name not in conf_groups:
             raise UnknownConfError(f"Unknown configuration group {group_name!r}")
 
-        conf_group = self._conf_groups[group_name]
+        conf_group = conf_groups[group_name]
+
+        # checking the underlying dict directly skips a Python-level
+        # ConfDepot.__contains__ call on every steady-state access
+        conf_depot = self._conf_depot
+        if group_name not in conf_depot._depot_groups:
+            return conf_group
 
-        if group_name in self._conf_depot:
-            conf_depot_group = self._conf_depot[group_name]
-            conf_group._update_from_conf_depot_group(conf_depot_group)
-            del self._conf_depot[group_name]
+        conf_group._update_from_conf_depot_group(conf_depot[group_name])
+        del conf_depot[group_name]
 
         return conf_group
 
@@ -306,25 +383,44 @@ class Conf:
             "registering new configuration group."
         )
 
-    def __setattr__(self, name, value):
-        if name in self.__slots__:
-            object.__setattr__(self, name, value)
+    def __setattr__(self, name, value, _object_setattr=object.__setattr__):
+        if name in self._SLOT_SET:
+            _object_setattr(self, name, value)
         else:
             self[name] = value
 
+    def _rebuild_dir_cache(self):
+        # group names only change in declare_group, so dir() can serve a
+        # precomputed tuple instead of re-listing on every call
+        self._dir_cache = tuple(object.__dir__(self)) + tuple(self._conf_groups)
+
     def __dir__(self):
-        return object.__dir__(self) + list(self._conf_groups.keys())
+        return list(self._dir_cache)
 
     def __deepcopy__(self, memo):
         cls = type(self)
         new_self = cls.__new__(cls)
         new_self._is_setting_imported = self._is_setting_imported
-        new_self._is_frozen = self._is_frozen
-        new_self._conf_depot = deepcopy(self._conf_depot)
-        new_self._conf_groups = deepcopy(self._conf_groups)
-
+        new_self._frozen_cell = list(self._frozen_cell)
+        # the depot back-references this Conf; memoize the copy first so
+        # the recursive deepcopy resolves the cycle to new_self
+        memo[id(self)] = new_self
+        new_self._conf_depot = deepcopy(self._conf_depot, memo)
+        # a comprehension builds the dict pre-sized for the known group
+        # count instead of growing it insertion by insertion
+        new_self._conf_groups = {
+            name: deepcopy(group, memo)
+            for name, group in self._conf_groups.items()
+        }
+        new_self._mutate_globally_ctx = _MutateGloballyContext(
+            new_self._frozen_cell)
+        new_self._c_ctx = _ConfectCContext(new_self._conf_depot)
+        new_self._dir_cache = self._dir_cache
+
+        frozen_cell = new_self._frozen_cell
         for group in new_self._conf_groups.values():
-            group._conf = weakref.proxy(new_self)
+            group._conf = new_self
+            group._frozen_cell = frozen_cell
 
         return new_self
 
@@ -350,9 +446,17 @@ class Conf:
         if not isinstance(path, Path):
             path = Path(path)
 
+        # repeat loads of the same unchanged file skip the
+        # tokenize/parse/compile pipeline
+        cache_key = (str(path), path.stat().st_mtime_ns)
+        code = _conf_file_code_cache.get(cache_key)
+        if code is None:
+            code = compile(path.read_text(), str(path), "exec")
+            _conf_file_code_cache[cache_key] = code
+
         with self.mutate_globally():
             with self._confect_c_ctx():
-                exec(path.open("r").read())
+                exec(code, {})
 
     def load_module(self, module_name):
         """Load python configuration file through import.
@@ -459,15 +563,18 @@ class Conf:
 class ConfGroupPropertySetter:
     __slots__ = ("_conf_group",)
 
+    _SLOT_SET = frozenset(__slots__)
+
     def __init__(self, conf_group):
         self._conf_group = conf_group
 
     def __getattr__(self, property_name):
         return self[property_name]
 
-    def __setattr__(self, property_name, value):
-        if property_name in self.__slots__:
-            object.__setattr__(self, property_name, value)
+    def __setattr__(self, property_name, value,
+                    _object_setattr=object.__setattr__):
+        if property_name in self._SLOT_SET:
+            _object_setattr(self, property_name, value)
         else:
             self[property_name] = value
 
@@ -480,41 +587,99 @@ class ConfGroupPropertySetter:
         else:
             conf_prop = ConfProperty(default)
 
-        self._conf_group._properties[property_name] = conf_prop
+        # interned keys make later _properties lookups hit the
+        # pointer-equality fast path
+        self._conf_group._properties[sys.intern(property_name)] = conf_prop
 
     def _update(self, default_properties):
         for p, v in default_properties.items():
             self[p] = v
 
 
+def _make_conf_group_class(group_name, properties):
+    """Build a ConfGroup subclass with a descriptor per known property.
+
+    Reading ``conf.group.prop`` through a class-level ``property`` stays
+    on the ``__getattribute__`` fast path instead of falling back to
+    ``__getattr__`` after a full MRO miss on every access. Each getter
+    closes over its ConfProperty record, so a read is an overlay check
+    plus ``prop.value`` -- no ``_properties`` dict lookup at all.
+    """
+    namespace = {"__slots__": ()}
+    for key, prop in properties.items():
+        if hasattr(ConfGroup, key):
+            # don't shadow ConfGroup methods or slots; these names keep
+            # resolving as before
+            continue
+
+        def fget(self, _key=key, _prop=prop):
+            overlay = self._overlay
+            if overlay is not None and _key in overlay:
+                return overlay[_key]
+            return _prop.value
+
+        namespace[key] = property(
+            fget=fget,
+            fset=lambda self, value, _key=key: self.__setitem__(_key, value),
+        )
+
+    def __getattr__(self, property_name, _group_name=group_name):
+        # every declared property is a class-level descriptor, so ending
+        # up here means the name is unknown -- no dict check needed
+        raise UnknownConfError(
+            f"Unknown {property_name!r} property in "
+            f"configuration group {_group_name!r}"
+        )
+
+    namespace["__getattr__"] = __getattr__
+    namespace["_dir_cache"] = tuple(properties)
+
+    return type(f"ConfGroup_{group_name}", (ConfGroup,), namespace)
+
+
 class ConfGroup:
-    __slots__ = ("_conf", "_name", "_properties")
+    __slots__ = ("_conf", "_name", "_properties", "_overlay", "_frozen_cell")
 
     def __init__(self, conf: Conf, name: str):
-        self._conf = weakref.proxy(conf)
+        # a plain back-reference; the Conf <-> ConfGroup cycle is handled
+        # fine by the cyclic garbage collector, and skipping the weakref
+        # proxy saves an indirection on every frozen-state check
+        self._conf = conf
         self._name = name
         self._properties = {}
+        self._overlay = None
+        self._frozen_cell = conf._frozen_cell
 
     def __getattr__(self, property_name):
         return self[property_name]
 
-    def __setattr__(self, property_name, value):
-        if property_name in self.__slots__:
-            object.__setattr__(self, property_name, value)
+    def __setattr__(self, property_name, value,
+                    _slots=frozenset(__slots__),
+                    _object_setattr=object.__setattr__):
+        # default arguments bind the slot set and ``object.__setattr__``
+        # as locals, avoiding a LOAD_GLOBAL and a linear tuple scan on
+        # every property write
+        if property_name in _slots:
+            _object_setattr(self, property_name, value)
         else:
             self[property_name] = value
 
     def __getitem__(self, property_name):
-        if property_name not in self._properties:
+        overlay = self._overlay
+        if overlay is not None and property_name in overlay:
+            return overlay[property_name]
+
+        properties = self._properties
+        if property_name not in properties:
             raise UnknownConfError(
                 f"Unknown {property_name!r} property in "
                 f"configuration group {self._name!r}"
             )
 
-        return self._properties[property_name].value
+        return properties[property_name].value
 
     def __setitem__(self, property_name, value):
-        if self._conf._is_frozen:
+        if self._frozen_cell[0]:
             raise FrozenConfPropError(
                 "Configuration properties are frozen.\n"
                 "Configuration properties can only be changed globally by "
@@ -523,27 +688,104 @@ class ConfGroup:
                 "And it can be changed locally in the context "
                 "created by `Conf.mutate_locally()`."
             )
+
+        properties = self._properties
+        overlay = self._overlay
+        if overlay is not None:
+            if property_name not in properties:
+                raise KeyError(property_name)
+            overlay[property_name] = value
         else:
-            self._properties[property_name].value = value
+            properties[property_name].value = value
+
+    # generated subclasses override this with the declared names; the
+    # fallback serves groups still under declaration
+    _dir_cache = None
 
     def __dir__(self):
-        return self._properties.keys()
+        if self._dir_cache is not None:
+            return list(self._dir_cache)
+
+        return list(self._properties.keys())
 
     @contextmanager
     def _default_setter(self):
         yield ConfGroupPropertySetter(self)
+        self._rebuild_accessors()
+
+    def _rebuild_accessors(self):
+        cls = _make_conf_group_class(self._name, self._properties)
+        object.__setattr__(self, "__class__", cls)
+
+    def _push_overlay(self):
+        """Activate a fresh overlay and return the one it replaces.
+
+        A nested ``mutate_locally`` seeds its overlay from the outer
+        one so the outer block's local values stay visible, and mutable
+        container values are copied into the overlay up front so
+        in-place mutation inside the block cannot leak out of it.
+        """
+        outer = self._overlay
+        overlay = {} if outer is None else dict(outer)
+        for name, prop in self._properties.items():
+            value = overlay[name] if name in overlay else prop.value
+            if isinstance(value, (list, dict, set)):
+                overlay[name] = deepcopy(value)
+
+        self._overlay = overlay
+        return outer
+
+    def _set_loaded_value(self, property_name, value):
+        """Apply a value from a config source, bypassing the frozen check.
+
+        Returns False when the property is unknown so the caller can
+        stash the value instead.
+        """
+        prop = self._properties.get(property_name)
+        if prop is None:
+            return False
+
+        overlay = self._overlay
+        if overlay is not None:
+            overlay[property_name] = value
+        else:
+            prop._value = value
+
+        return True
 
     def _update_from_conf_depot_group(self, conf_depot_group):
-        for conf_property, value in conf_depot_group._items():
-            if conf_property in self._properties:
-                self._properties[conf_property].value = value
+        # depot values are authoritative, so write the _value slot
+        # directly instead of going through the ``value`` property setter
+        properties = self._properties
+        overlay = self._overlay
+        if overlay is not None:
+            overlay.update(
+                (name, value)
+                for name, value in conf_depot_group._items()
+                if name in properties
+            )
+        else:
+            for name, value in conf_depot_group._items():
+                prop = properties.get(name)
+                if prop is not None:
+                    prop._value = value
 
     def __deepcopy__(self, memo):
         cls = type(self)
         new_self = cls.__new__(cls)
         new_self._conf = self._conf  # Don't need to copy conf
+        new_self._frozen_cell = self._frozen_cell
         new_self._name = self._name
-        new_self._properties = deepcopy(self._properties)
+        # go through deepcopy so the memo is consulted and a ConfProperty
+        # shared between groups keeps a single identity in the copy
+        new_self._properties = {
+            name: deepcopy(prop, memo)
+            for name, prop in self._properties.items()
+        }
+        new_self._overlay = dict(self._overlay) if self._overlay is not None else None
+        # the generated class' getters close over the original
+        # ConfProperty records; rebind them to the copies
+        new_self._rebuild_accessors()
         return new_self
 
     def get_prop(self, prop):
@@ -553,7 +795,7 @@ class ConfGroup:
         return self.get_prop(prop).prop_type.parse(string)
 
     def as_dict(self):
-        return {name: prob.value for name, prob in self._properties.items()}
+        return {name: self[name] for name in self._properties}
 
     def __repr__(self):
         return (
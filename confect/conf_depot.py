@@ -1,28 +1,40 @@
+import sys
 
 from confect.error import UnknownConfError
 
 
 class ConfDepot:
-    __slots__ = '_depot_groups'
+    __slots__ = ('_depot_groups', '_conf')
 
-    def __init__(self):
+    _SLOT_SET = frozenset(__slots__)
+
+    def __init__(self, conf=None):
         self._depot_groups = {}
+        self._conf = conf
 
     def __delitem__(self, group_name):
         del self._depot_groups[group_name]
 
     def __getitem__(self, group_name):
         if group_name not in self._depot_groups:
-            conf_depot_group = ConfDepotGroup()
-            self._depot_groups[group_name] = conf_depot_group
+            conf_group = None
+            if self._conf is not None:
+                conf_group = self._conf._conf_groups.get(group_name)
+
+            self._depot_groups[group_name] = ConfDepotGroup(conf_group)
 
         return self._depot_groups[group_name]
 
     def __getattr__(self, group_name):
+        if group_name.startswith('__') and group_name.endswith('__'):
+            # don't auto-create depot groups for special-method probes
+            # (e.g. copy.deepcopy looking up ``__deepcopy__``)
+            raise AttributeError(group_name)
+
         return self[group_name]
 
     def __setattr__(self, name, value):
-        if name in self.__slots__:
+        if name in self._SLOT_SET:
             object.__setattr__(self, name, value)
         else:
             raise TypeError(
@@ -41,31 +53,56 @@ class ConfDepot:
 
 
 class ConfDepotGroup:
-    __slots__ = '_depot_properties'
+    __slots__ = ('_depot_properties', '_conf_group')
 
-    def __init__(self):
+    _SLOT_SET = frozenset(__slots__)
+
+    def __init__(self, conf_group=None):
         self._depot_properties = {}
+        # the real ConfGroup when it was already declared at creation
+        # time; values for its known properties are written straight
+        # through instead of being stashed and re-merged on every access
+        self._conf_group = conf_group
 
     def _items(self):
         return self._depot_properties.items()
 
     def __getitem__(self, property_name):
         if property_name not in self._depot_properties:
+            conf_group = self._conf_group
+            if conf_group is not None and \
+                    property_name in conf_group._properties:
+                return conf_group[property_name]
+
             raise UnknownConfError(
                 f'ConfDepotGroup object has no property {property_name!r}'
             )
 
         return self._depot_properties[property_name]
 
-    def __setitem__(self, property_name, value):
-        self._depot_properties[property_name] = value
-
     def __getattr__(self, property_name):
+        if property_name.startswith('__') and property_name.endswith('__'):
+            # special-method probes (e.g. copy's __setstate__ lookup on a
+            # freshly __new__-ed instance) must not hit __getitem__, whose
+            # slot access would recurse back into __getattr__
+            raise AttributeError(property_name)
+
         return self[property_name]
 
-    def __setattr__(self, name, value):
-        if name in self.__slots__:
-            object.__setattr__(self, name, value)
+    def __setitem__(self, property_name, value):
+        conf_group = self._conf_group
+        if conf_group is not None and \
+                conf_group._set_loaded_value(property_name, value):
+            return
+
+        # property names arriving from config files or environment
+        # variables may not be interned yet; intern them so the merge
+        # into ConfGroup._properties compares by pointer
+        self._depot_properties[sys.intern(property_name)] = value
+
+    def __setattr__(self, name, value, _object_setattr=object.__setattr__):
+        if name in self._SLOT_SET:
+            _object_setattr(self, name, value)
         else:
             self[name] = value
 
@@ -1,8 +1,10 @@
 
+from copy import deepcopy
+
 import pytest
 
 from confect import (Conf, FrozenConfGroupError, FrozenConfPropError,
-                     UnknownConfError)
+                     UnknownConfError, prop)
 
 
 def test_declare_group():
@@ -54,6 +56,53 @@ def test_mutable_env(conf):
             conf.dummy = {'y': 4}
 
 
+def test_mutable_env_container(conf):
+    conf.declare_group('listy', items=prop(default=[1, 2]))
+    with conf.mutate_locally():
+        conf.listy.items.append(3)
+        assert conf.listy.items == [1, 2, 3]
+    assert conf.listy.items == [1, 2]
+
+
+def test_nested_mutable_env(conf):
+    with conf.mutate_locally():
+        conf.dummy.x = 5
+        with conf.mutate_locally():
+            conf.dummy.x = 7
+            assert conf.dummy.x == 7
+        assert conf.dummy.x == 5
+    assert conf.dummy.x == 3
+
+
+def test_mutable_env_exception(conf):
+    with pytest.raises(ValueError):
+        with conf.mutate_locally():
+            conf.dummy.x = 5
+            conf.declare_group('local_group', z=1)
+            raise ValueError
+
+    assert conf.dummy.x == 3
+    assert 'local_group' not in conf
+    assert 'local_group' not in dir(conf)
+
+    with pytest.raises(FrozenConfPropError):
+        conf.dummy.x = 5
+
+
+def test_deepcopy(conf):
+    conf_copy = deepcopy(conf)
+
+    with conf_copy.mutate_locally():
+        conf_copy.dummy.x = 5
+        assert conf_copy.dummy.x == 5
+        assert conf.dummy.x == 3
+
+    assert conf_copy.dummy.x == 3
+
+    with pytest.raises(FrozenConfPropError):
+        conf_copy.dummy.x = 5
+
+
 def test_getitem(conf):
     assert conf.dummy.x == 3
     assert conf['dummy']['x'] == 3
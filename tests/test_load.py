@@ -1,4 +1,7 @@
+import os
 import sys
+import textwrap
+from copy import deepcopy
 
 import pytest
 
@@ -93,6 +96,43 @@ def test_load_conf_before_declare(conf1_file, conf2_file):
     assert conf.yummy.name == 'fish'
 
 
+def test_load_edited_file(conf, tmpdir):
+    p = tmpdir.join('conf_edit.py')
+    p.write(textwrap.dedent('''
+        from confect import c
+        c.dummy.x = 5
+        '''))
+    conf.load_file(p)
+    assert conf.dummy.x == 5
+
+    p.write(textwrap.dedent('''
+        from confect import c
+        c.dummy.x = 7
+        '''))
+    # make sure the edit is visible even on coarse-grained filesystems
+    st = os.stat(str(p))
+    os.utime(str(p), ns=(st.st_atime_ns, st.st_mtime_ns + 1))
+    conf.load_file(p)
+    assert conf.dummy.x == 7
+
+
+def test_deepcopy_before_declare(conf1_file):
+    conf = Conf()
+    conf.load_file(conf1_file)
+    conf_copy = deepcopy(conf)
+
+    with pytest.raises(UnknownConfError):
+        conf_copy.dummy.x
+
+    with conf_copy.declare_group('dummy') as g:
+        g.x = 3
+
+    assert conf_copy.dummy.x == 5
+
+    with pytest.raises(UnknownConfError):
+        conf.dummy.x
+
+
 def test_load_module(conf, conf1_file):
 
     with pytest.raises(ImportError):